@@ -6,9 +6,10 @@ src.config_loader
 Contains functionality for loading and managing map configuration settings
 """
 
+import copy
 import json
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from typing import List, Union
 from pathlib import Path
 
@@ -16,10 +17,17 @@ from logger import get_logger
 from paths import get_assets_path
 from constants import VERSION_STR
 
+# orjson is optional - it is used for faster parsing if available (configs are
+# ... always written with json, as orjson can only indent by 2)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class MapConfig:
     """Class for storing and managing map configuration settings"""
 
@@ -45,8 +53,9 @@ class MapConfig:
             MapConfig: An instance of MapConfig with values from the JSON file
         """
         try:
-            with open(json_path, "r") as f:
-                config_data = json.load(f)
+            with open(json_path, "rb") as f:
+                raw_data = f.read()
+            config_data = orjson.loads(raw_data) if orjson else json.loads(raw_data)
 
             logger.info(f"Loaded configuration from {json_path}")
 
@@ -85,8 +94,9 @@ class MapConfig:
             json_path = Path(json_path)
             json_path.parent.mkdir(parents=True, exist_ok=True)
 
+            # NOTE slotted dataclass, so no __dict__ - use asdict instead
             with open(json_path, "w") as f:
-                json.dump(self.__dict__, f, indent=4)
+                json.dump(asdict(self), f, indent=4)
 
             logger.info(f"Saved configuration to {json_path}")
             return True
@@ -96,6 +106,10 @@ class MapConfig:
 
 
 # NON CLASS BASED FUNCTION BELOW
+# parsed configuration files, keyed by path -> (modified time, parsed config)
+_CFG_CACHE: dict[Path, tuple[float, MapConfig]] = {}
+
+
 def load_config(config_path: Union[str, Path] = None) -> MapConfig:
     """Convenience function to load configuration from a JSON file
 
@@ -107,5 +121,20 @@ def load_config(config_path: Union[str, Path] = None) -> MapConfig:
     """
     if config_path is None:
         config_path = get_assets_path() / "default.json"
-
-    return MapConfig.from_json(config_path)
+    config_path = Path(config_path)
+
+    try:
+        mtime = config_path.stat().st_mtime
+    except OSError:
+        # let from_json handle (and log) the missing file
+        return MapConfig.from_json(config_path)
+
+    # reuse the previously parsed config if the file hasn't changed - return a copy
+    # ... so changes to the config (e.g. setting the seed) don't affect the cache
+    cached = _CFG_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        logger.info(f"Using cached configuration from {config_path}")
+    else:
+        cached = (mtime, MapConfig.from_json(config_path))
+        _CFG_CACHE[config_path] = cached
+    return copy.deepcopy(cached[1])
@@ -15,5 +15,11 @@ PROGRESS_STEPS = 16
 # Logger name
 LOGGER_NAME = "hwae"
 
+# Log file name (saved in the new level folder)
+LOG_FILE_NAME = "hwae_log.csv"
+
 # New level name
 NEW_LEVEL_NAME = "HWAE_Level"
+
+# Scale from LEV grid coordinates to world coordinates (e.g. for the rally point)
+WORLD_SCALE = 10 * 51.7
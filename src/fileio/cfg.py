@@ -7,13 +7,16 @@ Contains all info to read and write HWAR's .cfg file type
 """
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Iterable, List
 from pathlib import Path
 from logger import get_logger
 
 logger = get_logger()
 import time
 
+# timestamp format for the file header (backslashes are intentional for HWAR)
+_TS_FMT = "%d\\%m\\%Y (%H:%M)"
+
 
 @dataclass
 class _CfgRecord:
@@ -35,37 +38,35 @@ class CfgFile:
         self.records = []
 
         if self.full_file_path and Path(self.full_file_path).exists():
+            # parse line by line as we read, rather than reading the whole file
             with open(self.full_file_path, "r") as f:
-                data = f.read()
-            # split into lines, then split into section headers and
-            # ... make a dict
-            self._parse_cfg_data(data)
+                self._parse_cfg_data(f)
 
-    def _parse_cfg_data(self, data):
-        """Parse the CFG file data"""
-        current_record = None
+    def _parse_cfg_data(self, lines: Iterable[str]) -> None:
+        """Parse the CFG file data
+
+        Args:
+            lines (Iterable[str]): Lines of the CFG file (e.g. an open file object)
+        """
+        # bound append method of the current section's values (None until the
+        # ... first section header, so any values before it are ignored)
+        add_value = None
 
         # Parse the data
-        for line in data.splitlines():
-            line = line.strip()
-            # strip comments and whitespace
-            if ";" in line:
-                line = line.split(";")[0].strip()
+        for line in lines:
+            # strip comments and whitespace (single split, no need to check for ;)
+            line = line.split(";", 1)[0].strip()
             if not line:
                 continue
 
             if line.startswith("["):
                 # New section found, create a new record
-                if current_record is not None:
-                    self.records.append(current_record)
                 current_record = _CfgRecord(line.strip("[]"), [])
-            elif current_record is not None:
+                self.records.append(current_record)
+                add_value = current_record.value.append
+            elif add_value is not None:
                 # Add content to current section
-                current_record.value.append(line)
-
-        # Don't forget to add the last record
-        if current_record is not None:
-            self.records.append(current_record)
+                add_value(line)
 
     def __getitem__(self, section: str) -> List[str]:
         """Gets a section value using dictionary style access
@@ -119,16 +120,16 @@ class CfgFile:
             str: Config data as a string
         """
         # create header
-        return_data = f";Created by HWAE at {time.strftime('%d\\%m\\%Y (%H:%M)')}\n"
+        parts = [f";Created by HWAE at {time.strftime(_TS_FMT)}"]
         for record in self.records:
             # Write section header
-            return_data += f"[{record.section}]\n"
+            parts.append(f"[{record.section}]")
             # Write section values
-            for value in record.value:
-                return_data += f"{value}\n"
+            parts.extend(str(value) for value in record.value)
             # Add blank line between sections
-            return_data += "\n"
-        return return_data
+            parts.append("")
+        # join once at the end (rather than building the string line by line)
+        return "\n".join(parts) + "\n"
 
     def save(self, save_in_folder: Path, file_name: str) -> None:
         """Saves the CFG file to the specified path, using the data stored
@@ -4,31 +4,45 @@ HWAE (Hostile Waters Antaeus Eternal)
 Python package (released as a pyinstaller exe) to generate additional maps for Hostile Waters: Antaeus Rising (2001)
 """
 
+import copy
 import os
 import shutil
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Any
 
-from fileio.cfg import CfgFile
-from fileio.lev import LevFile
-from fileio.ob3 import Ob3File
-from fileio.ars import ArsFile
-from fileio.pat import PatFile
-from fileio.ail import AilFile
-from fileio.ait import AitFile
-
-from construction import ConstructionManager
-from noisegen import NoiseGenerator
-from objects import ObjectHandler
-from terrain import TerrainHandler
-from texture import select_map_texture_group
-from minimap import generate_minimap
-from zone_manager import ZoneManager, ZoneType, ZoneSize, ZoneSubType
-from constants import NEW_LEVEL_NAME
+# NOTE the file/generation modules (which pull in numpy, PIL etc) are imported
+# ... inside generate_new_map, so the GUI can start without waiting on them
+from constants import NEW_LEVEL_NAME, WORLD_SCALE, LOG_FILE_NAME
 from paths import get_assets_path, get_templates_path, get_textures_path
 from logger import setup_logger, close_logger
 from config_loader import load_config, MapConfig
 
+# parsed template files, keyed by path -> (modified time, parsed object)
+_TEMPLATE_CACHE: dict[Path, tuple[float, Any]] = {}
+
+
+def _load_template(cls: type, path: Path) -> Any:
+    """Loads a template file via cls(path), reusing a previously parsed copy if the
+    file has not changed since. A deep copy is returned, so changes made during map
+    generation do not affect the cached template
+
+    Args:
+        cls (type): File class to parse the template with (e.g. CfgFile)
+        path (Path): Path to the template file
+
+    Returns:
+        Any: A fresh copy of the parsed template
+    """
+    mtime = path.stat().st_mtime
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, cls(path))
+        _TEMPLATE_CACHE[path] = cached
+    return copy.deepcopy(cached[1])
+
 
 def generate_new_map(
     progress_callback: callable,
@@ -56,6 +70,23 @@ def generate_new_map(
         # STEP 1 - INITALISATION -----------------------------------------------------------
         progress_callback("Starting...")
 
+        # Deferred imports (see note at top of file)
+        from fileio.cfg import CfgFile
+        from fileio.lev import LevFile
+        from fileio.ob3 import Ob3File
+        from fileio.ars import ArsFile
+        from fileio.pat import PatFile
+        from fileio.ail import AilFile
+        from fileio.ait import AitFile
+
+        from construction import ConstructionManager
+        from noisegen import NoiseGenerator
+        from objects import ObjectHandler
+        from terrain import TerrainHandler
+        from texture import select_map_texture_group
+        from minimap import generate_minimap
+        from zone_manager import ZoneManager, ZoneType, ZoneSize
+
         # Set up the logger
         logger = setup_logger(exe_parent / NEW_LEVEL_NAME)
 
@@ -79,26 +110,33 @@ def generate_new_map(
 
         # STEP 2 - CLEAN EXISTING FILES ----------------------------------------------------
         progress_callback("Cleaning existing files")
-        # check if the map folder exists - if so, remove all files in it
-        if (exe_parent / NEW_LEVEL_NAME).exists():
-            shutil.rmtree(exe_parent / NEW_LEVEL_NAME, ignore_errors=True)
+        # make sure the map folder exists, and remove all existing files in it (but
+        # ... keep the folder itself, and the log file we have just opened)
+        level_folder = exe_parent / NEW_LEVEL_NAME
+        level_folder.mkdir(parents=True, exist_ok=True)
+        with os.scandir(level_folder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                elif entry.name != LOG_FILE_NAME:
+                    os.remove(entry.path)
 
         # STEP 3 - SET UP COMMON FILES -----------------------------------------------------
         progress_callback("Importing common data")
         logger.info("Setting up file objects and copying template files")
-        cfg_data = CfgFile(template_root / f"{map_size_template}.cfg")
+        cfg_data = _load_template(CfgFile, template_root / f"{map_size_template}.cfg")
+        # NOTE the lev is not cached - it is quicker to parse than to deep copy
         lev_data = LevFile(template_root / f"{map_size_template}.lev")
-        ars_data = ArsFile(template_root / "common.ars")
-        ait_data = AitFile(template_root / "common.ait")
+        ars_data = _load_template(ArsFile, template_root / "common.ars")
+        ait_data = _load_template(AitFile, template_root / "common.ait")
         ob3_data = Ob3File("")
         pat_data = PatFile("")
         ail_data = AilFile("")
-        os.makedirs(exe_parent / NEW_LEVEL_NAME, exist_ok=True)
-        shutil.copy(
+        shutil.copyfile(
             template_root / "common.s0u",
             exe_parent / NEW_LEVEL_NAME / f"{NEW_LEVEL_NAME}.s0u",
         )
-        shutil.copy(
+        shutil.copyfile(
             template_root / "common.for",
             exe_parent / NEW_LEVEL_NAME / f"{NEW_LEVEL_NAME}.for",
         )
@@ -156,7 +194,8 @@ def generate_new_map(
         # and set rally point (which if no zone can fit is the same as the rally
         # ... point coords)
         yr = terrain_handler.get_height(xr, zr)
-        cfg_data["RallyPoint"] = f"{zr*10*51.7:.6f},{yr:.6f},{xr*10*51.7:.6f}"
+        xw, zw = xr * WORLD_SCALE, zr * WORLD_SCALE
+        cfg_data["RallyPoint"] = f"{zw:.6f},{yr:.6f},{xw:.6f}"
 
         # at least one tiny base
         zone_manager.generate_random_zones(
@@ -188,11 +227,30 @@ def generate_new_map(
         # STEP 9 - ZONE POPULATE -------------------------------------------------------
         progress_callback("Processing zones (texturing, flattening, populating)")
         logger.info("Processing zones (texturing, flattening, populating)")
+        # create all the zone masks first, in order (uses the noise generator)
         for zone in object_handler.zones:
+            zone.mask()
+        # the flattening falloff only depends on the zone masks, so calculate it
+        # ... for every zone in parallel, then apply in order below
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            falloff_distances = list(
+                executor.map(
+                    partial(
+                        terrain_handler.get_zone_falloff_distance,
+                        all_existing_zones=object_handler.zones,
+                    ),
+                    object_handler.zones,
+                )
+            )
+        for zone, falloff_distance in zip(object_handler.zones, falloff_distances):
             terrain_handler.apply_texture_based_on_zone(zone)
             terrain_handler.flatten_terrain_based_on_zone(
-                zone, all_existing_zones=object_handler.zones
+                zone,
+                all_existing_zones=object_handler.zones,
+                falloff_distance=falloff_distance,
             )
+            # flattening changes the terrain, so the land/water masks are stale
+            object_handler.invalidate_terrain_masks()
             zone.populate(noise_generator, object_handler)
 
         # STEP 10 - MISC OBJECTS -------------------------------------------------------
@@ -283,7 +341,7 @@ def generate_new_map(
             levels_file.rename(levels_file.with_suffix(".lst.bak"))
         # finally copy the template Levels.lst (after making the folder(s))
         levels_file.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy(template_levels, levels_file)
+        shutil.copyfile(template_levels, levels_file)
         logger.info("Saved Levels.lst")
 
         logger.info("Map generation complete!")
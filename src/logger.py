@@ -8,10 +8,11 @@ Custom logger for the HWAE application that logs to both console and a CSV file
 
 import logging
 import csv
+import os
 import datetime
 from pathlib import Path
 
-from constants import LOGGER_NAME
+from constants import LOGGER_NAME, LOG_FILE_NAME
 
 
 class CsvFormatter(logging.Formatter):
@@ -32,18 +33,51 @@ class CsvHandler(logging.FileHandler):
     def __init__(self, filename, mode="a", encoding=None, delay=False):
         """Initialize the handler with the CSV file"""
         super().__init__(filename, mode, encoding, delay)
+        self._write_header(filename)
+        self.setFormatter(CsvFormatter())
 
-        # Create CSV file with header if it doesn't exist or is empty
+    @staticmethod
+    def _write_header(filename):
+        """Create CSV file with header if it doesn't exist or is empty"""
         if not Path(filename).exists() or Path(filename).stat().st_size == 0:
             with open(filename, "w", newline="") as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(["Timestamp", "Level", "Message"])
 
-        self.setFormatter(CsvFormatter())
+    def release_file(self):
+        """Close the underlying file (releasing any file lock), but keep the handler
+        so it can be pointed at a new file via set_file"""
+        self.acquire()
+        try:
+            if self.stream:
+                self.flush()
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+
+    def set_file(self, filename):
+        """Point the handler at a new CSV file. The file is opened on the next
+        emitted record
+
+        Args:
+            filename (Path): Path to the new CSV file
+        """
+        self.release_file()
+        self.baseFilename = os.path.abspath(filename)
+        self._write_header(filename)
+
+
+# the handlers are created once and reused between calls of setup_logger
+# (the CSV handler is pointed at the new file, see set_file)
+_console_handler = None
+_csv_handler = None
 
 
 def setup_logger(output_path=None):
-    """Set up the HWAE logger
+    """Set up the HWAE logger. The console handler is only created the first
+    time this is called, and the CSV handler is reused (pointed at the new file)
+    on subsequent calls
 
     Args:
         output_path (Path, optional): Path to the output directory for the CSV log file.
@@ -52,19 +86,25 @@ def setup_logger(output_path=None):
     Returns:
         logging.Logger: The configured logger
     """
+    global _console_handler, _csv_handler
+
     # Get the logger
     logger = logging.getLogger(LOGGER_NAME)
-    logger.setLevel(logging.INFO)
 
-    # Remove any existing handlers
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    # Add console handler (once per process)
+    if _console_handler is None:
+        logger.setLevel(logging.INFO)
+        _console_handler = logging.StreamHandler()
+        console_formatter = logging.Formatter(
+            "%(asctime)s - %(levelname)s - %(message)s"
+        )
+        _console_handler.setFormatter(console_formatter)
+        logger.addHandler(_console_handler)
 
-    # Add console handler
-    console_handler = logging.StreamHandler()
-    console_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    # Detach the CSV handler from any previous output path
+    if _csv_handler is not None:
+        logger.removeHandler(_csv_handler)
+        _csv_handler.release_file()
 
     # Add CSV handler if output path is provided
     if output_path:
@@ -72,13 +112,16 @@ def setup_logger(output_path=None):
         Path(output_path).mkdir(parents=True, exist_ok=True)
 
         # if the logging file exists, remove it (so we get one log)
-        logpath = Path(output_path) / "hwae_log.csv"
+        logpath = Path(output_path) / LOG_FILE_NAME
         if logpath.exists():
             logpath.unlink()
 
-        # Create the CSV handler
-        csv_handler = CsvHandler(logpath)
-        logger.addHandler(csv_handler)
+        # Create (or re-point) the CSV handler
+        if _csv_handler is None:
+            _csv_handler = CsvHandler(logpath)
+        else:
+            _csv_handler.set_file(logpath)
+        logger.addHandler(_csv_handler)
 
     return logger
 
@@ -93,8 +136,9 @@ def get_logger():
 
 
 def close_logger():
-    """Close all handlers for the HWAE logger to release file locks"""
+    """Detach the CSV handler from the HWAE logger and close its file, to release
+    file locks. The console handler is kept for the next setup_logger call"""
     logger = logging.getLogger(LOGGER_NAME)
-    for handler in logger.handlers[:]:
-        handler.close()
-        logger.removeHandler(handler)
+    if _csv_handler is not None:
+        logger.removeHandler(_csv_handler)
+        _csv_handler.release_file()
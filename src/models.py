@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import IntEnum, auto
+from itertools import accumulate
 from enums import Team
 from typing import Union
 
@@ -86,7 +87,7 @@ class ZoneMarker:
         return ZONE_TYPE_TO_TEXTURE_ID[self.zone_type]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObjectContainer:
     """Container for object data used in zone population"""
 
@@ -99,3 +100,24 @@ class ObjectContainer:
     template_x_offset: float = 0
     template_z_offset: float = 0
     template_y_offset: float = 0
+
+
+@dataclass(frozen=True, slots=True)
+class WeightedTable:
+    """Fixed weighted pool of objects (e.g. zone objects), stored as the objects
+    and their running weight totals so a weighted selection is a binary search"""
+
+    items: tuple = ()
+    cumulative_weights: tuple[int, ...] = ()
+
+    @classmethod
+    def from_dict(cls, weights: dict) -> "WeightedTable":
+        """Creates a weighted table from a dictionary of {item: weight}
+
+        Args:
+            weights (dict): Dictionary of items and their weights/likelihoods
+
+        Returns:
+            WeightedTable: The weighted table
+        """
+        return cls(tuple(weights), tuple(accumulate(weights.values())))
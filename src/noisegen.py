@@ -6,31 +6,69 @@ src.noisegen
 Noise generation functions for terrain, textures etc
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
-import random
+from typing import Optional
 import numpy as np
 from perlin_numpy import generate_fractal_noise_2d
 
+from models import WeightedTable
+
+# perlin noise settings used for all noise maps
+NOISE_RES = (8, 8)
+NOISE_OCTAVES = 5
+NOISE_PERSISTENCE = 0.4
+NOISE_LACUNARITY = 2
+
+# number of random integers to draw at a time for NoiseGenerator.randint
+RANDINT_BUFFER_SIZE = 4096
+
 
 @dataclass
 class NoiseGenerator:
     seed: int = 0
 
     def __post_init__(self):
-        if self.seed:
-            random.seed(self.seed)
-            np.random.seed(self.seed)
-        else:
+        if not self.seed:
             self.seed = int(np.random.rand() * (2**32 - 1))
-            random.seed(self.seed)
-            np.random.seed(self.seed)
+        # all random values come from this instance's generator (rather than the
+        # ... global random/np.random state), so generators don't interfere
+        self._rng = np.random.default_rng(self.seed)
+        # randint draws come from a pre-filled buffer (refilled when exhausted),
+        # ... rather than calling into numpy for every single value
+        self._fill_randint_buffer()
+
+    def _fill_randint_buffer(self) -> None:
+        """(Re)fills the buffer of random uint32 values used by randint"""
+        self._u32_buf = self._rng.integers(
+            0, 2**32, size=RANDINT_BUFFER_SIZE, dtype=np.uint32
+        )
+        self._u32_idx = 0
 
     def get_seed(self):
         # get the current seed form numpy
         return self.seed
 
     def randint(self, min, max):
-        return np.random.randint(min, max)
+        """Returns a random integer in the range [min, max)
+
+        Args:
+            min (int): Lowest value (inclusive)
+            max (int): Highest value (exclusive)
+
+        Returns:
+            int: Random integer
+
+        Raises:
+            ValueError: If max is not greater than min
+        """
+        if max <= min:
+            raise ValueError(f"randint: max ({max}) must be greater than min ({min})")
+        if self._u32_idx >= RANDINT_BUFFER_SIZE:
+            self._fill_randint_buffer()
+        value = int(self._u32_buf[self._u32_idx])
+        self._u32_idx += 1
+        return min + value % (max - min)
 
     def random_noisemap(
         self,
@@ -49,34 +87,43 @@ class NoiseGenerator:
             np.ndarray: 2D noise map
         """
         # create perlin noise map
-        map = generate_fractal_noise_2d((height, width), (8, 8), 5, persistence=0.4)
-        # scale the entire map to have a value between 0 and 1
-        map = (map - np.min(map)) / (np.max(map) - np.min(map))
+        map = generate_fractal_noise_2d(
+            (height, width),
+            NOISE_RES,
+            NOISE_OCTAVES,
+            persistence=NOISE_PERSISTENCE,
+            lacunarity=NOISE_LACUNARITY,
+            rng=self._rng,
+        )
+        # scale the entire map to have a value between 0 and 1 (in place)
+        map -= map.min()
+        map /= map.max()
         # apply floor/cutoff (typically used for terrain)
         map[map < cutoff] = 0
         return map
 
-    def select_random_entry_from_2d_array(self, arr: np.ndarray) -> tuple[int, int]:
+    def select_random_entry_from_2d_array(
+        self, arr: np.ndarray
+    ) -> Optional[tuple[int, int]]:
         """Select a random entry from a 2D array (only if the array value is > 0)
 
         Args:
             arr (np.ndarray): 2D array to select a point from
 
         Returns:
-            tuple[int, int]: The x and y coordinates of the selected point in the array
+            Optional[tuple[int, int]]: The x and y coordinates of the selected point
+            ...in the array, or None if no value is > 0
         """
-        # iterate over the array dimensions, creating a list of tuples if
-        # ... the array value is > 0
-        possible_values = [
-            (x, z)
-            for x in range(arr.shape[0])
-            for z in range(arr.shape[1])
-            if arr[x, z] > 0
-        ]
+        # get the flat (row-major) indices of all values > 0 - same ordering as
+        # ... iterating x then z, so the same seed picks the same entry
+        possible_values = np.flatnonzero(arr > 0)
+        if possible_values.size == 0:
+            return None
         # select a random value from the possible_values
-        result = possible_values[self.randint(0, len(possible_values))]
-        # deconstruct
-        return result[0], result[1]
+        result = possible_values[self.randint(0, possible_values.size)]
+        # and convert back to 2d coordinates
+        x, z = divmod(int(result), arr.shape[1])
+        return x, z
 
     def select_random_from_list(self, in_list: list) -> object:
         """Selects a random object from a list
@@ -89,6 +136,17 @@ class NoiseGenerator:
         """
         return in_list[self.randint(0, len(in_list))]
 
+    def random_permutation(self, n: int) -> np.ndarray:
+        """Returns the integers [0, n) in a random order
+
+        Args:
+            n (int): Number of integers to shuffle
+
+        Returns:
+            np.ndarray: Randomly ordered indices
+        """
+        return self._rng.permutation(n)
+
     def select_random_sublist_from_list(
         self, in_list: list, min_n: int = 1, max_n: int = 9999
     ) -> list:
@@ -111,7 +169,9 @@ class NoiseGenerator:
             k = min_n if min_n == list_length else self.randint(min_n, list_length)
         else:
             k = min_n if min_n == max_n else self.randint(min_n, max_n)
-        return random.sample(in_list, k=k)
+        # pick k unique indices (via the instance rng) and index back into the list
+        indices = self._rng.choice(list_length, size=k, replace=False)
+        return [in_list[i] for i in indices]
 
     def select_random_from_weighted_dict(self, in_dict: dict) -> object:
         """Selects a random object from a dictionary, where the values are weights
@@ -123,9 +183,18 @@ class NoiseGenerator:
         Returns:
             object: Random object from the dictionary, weighted by the likelihood values
         """
-        # Create a flat list where each key appears value times
-        weighted_keys = []
-        for key, weight in in_dict.items():
-            weighted_keys.extend([key] * weight)
-        # Select randomly from this weighted list
-        return self.select_random_from_list(weighted_keys)
+        return self.select_random_from_weighted_table(WeightedTable.from_dict(in_dict))
+
+    def select_random_from_weighted_table(self, table: WeightedTable) -> object:
+        """Selects a random object from a weighted table
+
+        Args:
+            table (WeightedTable): Table to select from
+
+        Returns:
+            object: Random object from the table, weighted by the likelihood values
+        """
+        # pick a point in the total weight, then find the item whose running total
+        # ... range covers it (same pick as a flat list with each item weight times)
+        point = self.randint(0, table.cumulative_weights[-1])
+        return table.items[bisect_right(table.cumulative_weights, point)]
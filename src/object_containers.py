@@ -1,18 +1,8 @@
 from models import (
     Team,
+    WeightedTable,
     ObjectContainer,
 )
-from enum import IntEnum, auto
-from dataclasses import dataclass
-
-
-class Team(IntEnum):
-    """Team enumeration for objects"""
-
-    PLAYER = 0
-    ENEMY = 1
-    NEUTRAL = 4294967295  # 0xFFFFFFFF
-
 
 # TEMPLATES
 
@@ -286,15 +276,17 @@ BASE_OIL_PUMP = ObjectContainer(
     team=Team.ENEMY,
     required_radius=1,
 )
-PUMP_OUTPOST_PRIORITY = {BASE_OIL_PUMP: 1}
-PUMP_OUTPOST_ALL = {
-    BASE_WALL_GUN: 4,
-    BASE_LIGHTNING_GUN: 2,
-    BASE_BLAST_TOWER: 3,
-    TEMPLATE_ALIEN_AA: 2,
-    BASE_OIL_PUMP: 3,
-    TEMPLATE_ALIEN_RADAR: 1,
-}
+PUMP_OUTPOST_PRIORITY = WeightedTable.from_dict({BASE_OIL_PUMP: 1})
+PUMP_OUTPOST_ALL = WeightedTable.from_dict(
+    {
+        BASE_WALL_GUN: 4,
+        BASE_LIGHTNING_GUN: 2,
+        BASE_BLAST_TOWER: 3,
+        TEMPLATE_ALIEN_AA: 2,
+        BASE_OIL_PUMP: 3,
+        TEMPLATE_ALIEN_RADAR: 1,
+    }
+)
 # SPECIAL TYPE - BASE -----------------------------------------
 BASE_ALIEN_POWER_STORE = ObjectContainer(
     object_type="alienpowerstore",
@@ -322,29 +314,35 @@ BASE_COM = ObjectContainer(
     team=Team.ENEMY,
     required_radius=5,
 )
-BASE_PRIORITY1 = {
-    TEMPLATE_ALIEN_GROUND_PROD_WITH_UNITS: 6,
-    TEMPLATE_ALIEN_AIR_PROD_WITH_UNITS: 6,
-    TEMPLATE_ALIEN_LARGE_PROD_WITH_UNITS: 6,
-    BASE_COM: 1,
-}
-BASE_PRIORITY2 = {
-    TEMPLATE_ALIEN_ENERGY_POWER_STORE_TRIANGLE: 1,
-}
-BASE_ALL_OTHER = {
-    BASE_WALL_GUN: 8,
-    BASE_LIGHTNING_GUN: 8,
-    BASE_BLAST_TOWER: 8,
-    TEMPLATE_ALIEN_AA: 4,
-    BASE_GROUND_PROD: 2,
-    BASE_AIR_PROD: 2,
-    BASE_LARGE_PROD: 2,
-    TEMPLATE_ALIEN_GROUND_PROD_WITH_UNITS: 1,
-    TEMPLATE_ALIEN_AIR_PROD_WITH_UNITS: 1,
-    BASE_OIL_PUMP: 3,
-    BASE_COM: 2,
-    TEMPLATE_ALIEN_RADAR: 1,
-}
+BASE_PRIORITY1 = WeightedTable.from_dict(
+    {
+        TEMPLATE_ALIEN_GROUND_PROD_WITH_UNITS: 6,
+        TEMPLATE_ALIEN_AIR_PROD_WITH_UNITS: 6,
+        TEMPLATE_ALIEN_LARGE_PROD_WITH_UNITS: 6,
+        BASE_COM: 1,
+    }
+)
+BASE_PRIORITY2 = WeightedTable.from_dict(
+    {
+        TEMPLATE_ALIEN_ENERGY_POWER_STORE_TRIANGLE: 1,
+    }
+)
+BASE_ALL_OTHER = WeightedTable.from_dict(
+    {
+        BASE_WALL_GUN: 8,
+        BASE_LIGHTNING_GUN: 8,
+        BASE_BLAST_TOWER: 8,
+        TEMPLATE_ALIEN_AA: 4,
+        BASE_GROUND_PROD: 2,
+        BASE_AIR_PROD: 2,
+        BASE_LARGE_PROD: 2,
+        TEMPLATE_ALIEN_GROUND_PROD_WITH_UNITS: 1,
+        TEMPLATE_ALIEN_AIR_PROD_WITH_UNITS: 1,
+        BASE_OIL_PUMP: 3,
+        BASE_COM: 2,
+        TEMPLATE_ALIEN_RADAR: 1,
+    }
+)
 
 
 ### SCRAP OBJECTS
@@ -401,29 +399,35 @@ GENERIC_DESTROYED_STORE = ObjectContainer(
 GENERIC_DESTROYED_WALL = ObjectContainer(
     object_type="Smashedwall", team=Team.NEUTRAL, required_radius=1, y_offset=2
 )
-DESTROYED_BASE_PRIORITY = {
-    GENERIC_DESTROYED_GROUND_PROD: 5,
-    GENERIC_DESTROYED_STORE: 1,
-    GENERIC_DESTROYED_WALL: 1,
-}
-SCRAP_DESTROYED_BASE = {
-    SCRAP_L1SCAVBENTPIPE: 5,
-    SCRAP_L1SCAVHOLEPIPE: 5,
-    SCRAP_L1SCAVBENTBACKGUN: 1,
-    SCRAP_L1SCAVBENTGUN: 1,
-    SCRAP_DESTROYED_COPTER: 1,
-    SCRAP_TANKWRECK: 1,
-    SCRAP_TANKWRECK1: 1,
-    SCRAP_TANKWRECK2: 1,
-    GENERIC_DESTROYED_STORE: 1,
-}
+DESTROYED_BASE_PRIORITY = WeightedTable.from_dict(
+    {
+        GENERIC_DESTROYED_GROUND_PROD: 5,
+        GENERIC_DESTROYED_STORE: 1,
+        GENERIC_DESTROYED_WALL: 1,
+    }
+)
+SCRAP_DESTROYED_BASE = WeightedTable.from_dict(
+    {
+        SCRAP_L1SCAVBENTPIPE: 5,
+        SCRAP_L1SCAVHOLEPIPE: 5,
+        SCRAP_L1SCAVBENTBACKGUN: 1,
+        SCRAP_L1SCAVBENTGUN: 1,
+        SCRAP_DESTROYED_COPTER: 1,
+        SCRAP_TANKWRECK: 1,
+        SCRAP_TANKWRECK1: 1,
+        SCRAP_TANKWRECK2: 1,
+        GENERIC_DESTROYED_STORE: 1,
+    }
+)
 # SPECIAL - tank/chopperbattle -----------------------------------------
-SCRAP_BATTLE = {
-    SCRAP_TANKWRECK: 1,
-    SCRAP_TANKWRECK1: 1,
-    SCRAP_TANKWRECK2: 1,
-    SCRAP_DESTROYED_COPTER: 1,
-}
+SCRAP_BATTLE = WeightedTable.from_dict(
+    {
+        SCRAP_TANKWRECK: 1,
+        SCRAP_TANKWRECK1: 1,
+        SCRAP_TANKWRECK2: 1,
+        SCRAP_DESTROYED_COPTER: 1,
+    }
+)
 # SPECIAL - weapon crate (special ars logic)-----------------------------------------
 SCRAP_WEAPON_CRATE = ObjectContainer(
     object_type="recharge_crate",
@@ -445,19 +449,25 @@ SCRAP_TRUCK = ObjectContainer(
     team=Team.NEUTRAL,
     required_radius=1,
 )
-WEAPON_CRATE_SCRAP_PRIORITY = {
-    SCRAP_WEAPON_CRATE: 1,
-}
-WEAPON_CRATE_SCRAP_OTHERS = {
-    SMALL_BOX: 4,
-    GREEN_BOX: 8,
-    SCRAP_TRUCK: 1,
-}
+WEAPON_CRATE_SCRAP_PRIORITY = WeightedTable.from_dict(
+    {
+        SCRAP_WEAPON_CRATE: 1,
+    }
+)
+WEAPON_CRATE_SCRAP_OTHERS = WeightedTable.from_dict(
+    {
+        SMALL_BOX: 4,
+        GREEN_BOX: 8,
+        SCRAP_TRUCK: 1,
+    }
+)
 # SPECIAL - scrap fuel tanks -----------------------------------------
-SCRAP_FUEL_TANKS = {
-    TEMPLATE_6_BY_2_SILO: 2,
-    TEMPLATE_4_BY_2_SILO: 2,
-    TEMPLATE_SCRAP_3_OILTANKS: 2,
-    SCRAP_L2FUELTANK: 1,
-    SCRAP_L2FUELSILO: 1,
-}
+SCRAP_FUEL_TANKS = WeightedTable.from_dict(
+    {
+        TEMPLATE_6_BY_2_SILO: 2,
+        TEMPLATE_4_BY_2_SILO: 2,
+        TEMPLATE_SCRAP_3_OILTANKS: 2,
+        SCRAP_L2FUELTANK: 1,
+        SCRAP_L2FUELSILO: 1,
+    }
+)
@@ -14,8 +14,10 @@ logger = get_logger()
 
 from dataclasses import dataclass
 from enum import IntEnum, auto
+from functools import lru_cache
+from math import isqrt
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 import numpy as np
 
@@ -38,6 +40,42 @@ from object_containers import (
 )
 from noisegen import NoiseGenerator
 
+# number of each scenery object to add to the map
+_SCENERY_COUNTS = {
+    "troprockcd": 8,
+    "troprockbd": 7,
+    "troprockad": 6,
+    "troprockcw": 5,
+    "troprockaw": 2,
+    "palm1": 80,
+    "plant1": 30,
+    "palm2": 50,
+    "palm3": 25,
+    "rubblea": 5,
+    "rubbleb": 5,
+    "rubblec": 5,
+    "rubbled": 5,
+    "rubblee": 5,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_disk(radius: int) -> np.ndarray:
+    """Returns a (2*radius+1, 2*radius+1) boolean kernel, which is True within the
+    radius of the center point. Cached per radius, as the same radii are stamped
+    many times (so the returned array is read only)
+
+    Args:
+        radius (int): Radius of the disk (must be integer)
+
+    Returns:
+        np.ndarray: Boolean disk kernel
+    """
+    offsets = np.arange(-radius, radius + 1)
+    disk = offsets[:, None] ** 2 + offsets[None, :] ** 2 <= radius * radius
+    disk.flags.writeable = False
+    return disk
+
 
 class LocationEnum(IntEnum):
     LAND = auto()
@@ -57,16 +95,40 @@ class ObjectHandler:
             (
                 self.terrain_handler.width,
                 self.terrain_handler.length,
-            )
+            ),
+            dtype=bool,
         )
         self.zones = []
+        self.invalidate_terrain_masks()
+        # scratch buffers for the transition mask of every location search
+        width, length = self.terrain_handler.width, self.terrain_handler.length
+        self._scratch_transition = np.empty((width, length), dtype=bool)
+        self._scratch_hdiff = np.empty((width, length - 1), dtype=bool)
+        self._scratch_vdiff = np.empty((width - 1, length), dtype=bool)
+
+    def invalidate_terrain_masks(self) -> None:
+        """Clears the cached heights and land/water/coast masks - must be called
+        whenever the terrain heights are changed (e.g. zone flattening)"""
+        self._heights: Optional[np.ndarray] = None
+        self._terrain_masks: dict[tuple, np.ndarray] = {}
+
+    def _get_heights(self) -> np.ndarray:
+        """Returns the (cached, read only) 2D array of terrain heights
+
+        Returns:
+            np.ndarray: Terrain heights (same dimensions as the terrain)
+        """
+        if self._heights is None:
+            self._heights = self.terrain_handler._get_height_2d_array()
+            self._heights.flags.writeable = False
+        return self._heights
 
     def _update_mask_grid_with_radius(
         self, location_grid: np.ndarray, x: int, z: int, radius: int, set_to: int = 0
     ) -> None:
-        """Updates the location grid to set_to in a radius around a location - used
-        for object location masking or similar. Uses a simpler distance calculation
-        since we only need integer radius.
+        """Updates the location grid (in place) to set_to in a radius around a
+        location - used for object location masking or similar. Uses a simpler
+        distance calculation since we only need integer radius.
 
         Args:
             location_grid (np.ndarray): Location grid to set 0 within
@@ -80,19 +142,18 @@ class ObjectHandler:
         x_max = min(self.terrain_handler.width, x + radius + 1)
         z_min = max(0, z - radius)
         z_max = min(self.terrain_handler.length, z + radius + 1)
+        # nothing to do if the circle is entirely off the grid
+        if x_min >= x_max or z_min >= z_max:
+            return
 
-        # For integer radius, we can just iterate through the square and check distance
-        radius_sq = radius * radius  # Square once instead of sqrt
-        for i in range(x_min, x_max):
-            dx = i - x
-            dx_sq = dx * dx
-            for j in range(z_min, z_max):
-                dz = j - z
-                # If point is within radius, set it
-                if dx_sq + dz * dz <= radius_sq:
-                    location_grid[i, j] = set_to
-
-        return location_grid
+        # Get the (cached) disk for this radius, clipped where the circle goes
+        # ... over the edge of the grid, and set the points inside it
+        disk = _get_disk(radius)
+        disk = disk[
+            x_min - (x - radius) : x_max - (x - radius),
+            z_min - (z - radius) : z_max - (z - radius),
+        ]
+        location_grid[x_min:x_max, z_min:z_max][disk] = set_to
 
     def _update_cached_object_mask(self, x: int, z: int, required_radius: int) -> None:
         """Updates the cached object mask with a new object's radius
@@ -102,11 +163,13 @@ class ObjectHandler:
             z (int): z location of new object
             required_radius (int): radius to mark as occupied
         """
-        self._cached_object_mask = self._update_mask_grid_with_radius(
+        self._update_mask_grid_with_radius(
             self._cached_object_mask, x, z, required_radius, set_to=0
         )
 
-    def _get_binary_transition_mask(self, input_mask: np.ndarray) -> np.ndarray:
+    def _get_binary_transition_mask(
+        self, input_mask: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """Generates a boolean edge transition mask, used for object radius checks
         as well as terrain transition checks (water-land etc). Iterates over the
         input mask, identifying the 2d cells where the state transitions to/from
@@ -114,28 +177,73 @@ class ObjectHandler:
 
         Args:
             input_mask (np.ndarray): Input mask to check
+            out (np.ndarray, optional): Terrain sized boolean buffer to write the
+            ...result into (also reuses the scratch difference buffers), so it is
+            ...only valid until the next call. Defaults to None (new arrays).
 
         Returns:
             np.ndarray: Mask of edges from the input mask
         """
-        # Create output mask of same shape as input
-        transition_mask = np.zeros_like(input_mask, dtype=int)
+        # Create output mask of same shape as input (or clear the given buffer)
+        if out is None:
+            transition_mask = np.zeros_like(input_mask, dtype=bool)
+            horizontal_transitions = vertical_transitions = None
+        else:
+            transition_mask = out
+            transition_mask[...] = False
+            horizontal_transitions = self._scratch_hdiff
+            vertical_transitions = self._scratch_vdiff
 
         # Check horizontal transitions (left to right)
-        horizontal_transitions = (input_mask[:, 1:] != input_mask[:, :-1]).astype(int)
-        transition_mask[:, 1:] += horizontal_transitions
-        transition_mask[:, :-1] += horizontal_transitions
+        horizontal_transitions = np.not_equal(
+            input_mask[:, 1:], input_mask[:, :-1], out=horizontal_transitions
+        )
+        transition_mask[:, 1:] |= horizontal_transitions
+        transition_mask[:, :-1] |= horizontal_transitions
 
         # Check vertical transitions (top to bottom)
-        vertical_transitions = (input_mask[1:, :] != input_mask[:-1, :]).astype(int)
-        transition_mask[1:, :] += vertical_transitions
-        transition_mask[:-1, :] += vertical_transitions
-
-        # Convert any non-zero values to 1
-        transition_mask = (transition_mask > 0).astype(int)
+        vertical_transitions = np.not_equal(
+            input_mask[1:, :], input_mask[:-1, :], out=vertical_transitions
+        )
+        transition_mask[1:, :] |= vertical_transitions
+        transition_mask[:-1, :] |= vertical_transitions
 
         return transition_mask
 
+    def _dilate_mask(self, input_mask: np.ndarray, radius: int) -> np.ndarray:
+        """Returns a boolean mask which is True within radius of any True point in
+        the input mask - the same as stamping a disk of radius at every point
+
+        Args:
+            input_mask (np.ndarray): Boolean mask of points to dilate
+            radius (int): Radius around each point (must be integer)
+
+        Returns:
+            np.ndarray: Dilated mask
+        """
+        # a zero radius is just the points themselves
+        if radius == 0:
+            return input_mask.copy()
+        # dilate one row offset of the disk at a time - for row offset dx the
+        # ... disk spans +-isqrt(radius^2 - dx^2) along z, so a sliding window
+        # ... count along each row finds every point covered from that offset
+        width, length = input_mask.shape
+        dilated_mask = np.zeros_like(input_mask, dtype=bool)
+        counts = np.zeros((width, length + 1), dtype=np.int32)
+        np.cumsum(input_mask, axis=1, out=counts[:, 1:])
+        z = np.arange(length)
+        for dx in range(-min(radius, width - 1), min(radius, width - 1) + 1):
+            half_span = isqrt(radius * radius - dx * dx)
+            z_min = np.maximum(z - half_span, 0)
+            z_max = np.minimum(z + half_span + 1, length)
+            covered = counts[:, z_max] > counts[:, z_min]
+            # row x of the output is covered by input row x + dx
+            if dx >= 0:
+                dilated_mask[: width - dx] |= covered[dx:]
+            else:
+                dilated_mask[-dx:] |= covered[: width + dx]
+        return dilated_mask
+
     def _get_object_mask(self) -> np.ndarray:
         """Returns the cached object mask. The mask is maintained by _update_cached_object_mask
         which is called whenever a new object is added.
@@ -157,11 +265,12 @@ class ObjectHandler:
             (
                 self.terrain_handler.width,
                 self.terrain_handler.length,
-            )
+            ),
+            dtype=bool,
         )
         # then check each zone (remove the zone from each)
         for zone in self.zones:
-            zone_seperation_mask = self._update_mask_grid_with_radius(
+            self._update_mask_grid_with_radius(
                 zone_seperation_mask, zone.x, zone.z, extra_zone_spacing, set_to=0
             )
         return zone_seperation_mask
@@ -181,13 +290,14 @@ class ObjectHandler:
             (
                 self.terrain_handler.width,
                 self.terrain_handler.length,
-            )
+            ),
+            dtype=bool,
         )
         # then check each zone (remove the zone from each)
         for zone in self.zones:
             if zone in exclude_zones:
                 continue
-            zone_mask = self._update_mask_grid_with_radius(
+            self._update_mask_grid_with_radius(
                 zone_mask,
                 zone.x,
                 zone.z,
@@ -224,11 +334,10 @@ class ObjectHandler:
             (
                 self.terrain_handler.width,
                 self.terrain_handler.length,
-            )
-        )
-        inclusion_mask = self._update_mask_grid_with_radius(
-            inclusion_mask, x, z, radius, set_to=1
+            ),
+            dtype=bool,
         )
+        self._update_mask_grid_with_radius(inclusion_mask, x, z, radius, set_to=1)
         return inclusion_mask
 
     def get_exclusion_mask_at_location(self, x: int, z: int, radius: int) -> np.ndarray:
@@ -247,13 +356,26 @@ class ObjectHandler:
             (
                 self.terrain_handler.width,
                 self.terrain_handler.length,
-            )
-        )
-        exclusion_mask = self._update_mask_grid_with_radius(
-            exclusion_mask, x, z, radius, set_to=0
+            ),
+            dtype=bool,
         )
+        self._update_mask_grid_with_radius(exclusion_mask, x, z, radius, set_to=0)
         return exclusion_mask
 
+    def _store_terrain_mask(self, key: tuple, mask: np.ndarray) -> np.ndarray:
+        """Caches a terrain mask (read only, as it is shared between callers)
+
+        Args:
+            key (tuple): Cache key (location type and mask arguments)
+            mask (np.ndarray): Mask to cache
+
+        Returns:
+            np.ndarray: The cached mask
+        """
+        mask.flags.writeable = False
+        self._terrain_masks[key] = mask
+        return mask
+
     def _get_land_mask(self, cutoff_height=-20) -> np.ndarray:
         """Generates a boolean map grid, where 1 is land and 0 is water via terrain
         lookup. Is returned in the same dimensions as the terrain (e.g. LEV scale).
@@ -265,55 +387,38 @@ class ObjectHandler:
         Returns:
             np.ndarray: Land mask
         """
-        # assume more water than land, so start with zeros
-        mask = np.zeros(
-            (
-                self.terrain_handler.width,
-                self.terrain_handler.length,
-            )
-        )
-        # check each point against the raw terrain height
-        for x in range(self.terrain_handler.width):
-            for z in range(self.terrain_handler.length):
-                if self.terrain_handler.get_height(x, z) > cutoff_height:
-                    mask[x, z] = 1
+        # the terrain doesn't change while placing objects, so reuse the last mask
+        key = (LocationEnum.LAND, cutoff_height)
+        if key in self._terrain_masks:
+            return self._terrain_masks[key]
+        # check every point against the raw terrain height at once
+        heights = self._get_heights()
+        mask = heights > cutoff_height
         # setback everything radius 6 from the edge - to avoid things appearing
         # ... awkwardly on the edge of a cliff etc
-        binary_terrain = self.terrain_handler._get_height_2d_array().copy()
-        binary_terrain[binary_terrain < 0] = 0
-        binary_terrain[binary_terrain > 0] = 1
-        edge_mask = self._get_binary_transition_mask(binary_terrain)
-        for x in range(self.terrain_handler.width):
-            for z in range(self.terrain_handler.length):
-                if edge_mask[x, z] == 1:
-                    mask = self._update_mask_grid_with_radius(mask, x, z, 6, set_to=0)
-        return mask
+        edge_mask = self._get_binary_transition_mask(heights > 0)
+        mask &= ~self._dilate_mask(edge_mask, 6)
+        return self._store_terrain_mask(key, mask)
 
     def _get_water_mask(self, cutoff_height=-20) -> np.ndarray:
         """Generates a boolean map grid, where 1 is water and 0 is land via terrain
         lookup. Is returned in the same dimensions as the terrain (e.g. LEV scale).
 
         Args:
-            cutoff_height (float, optional): Height above which is considered water.
-            Defaults to -20.
+            cutoff_height (float, optional): Height at or below which is considered
+            water. Defaults to -20.
 
         Returns:
             np.ndarray: Water mask
         """
-        # assume more water than land, so start with zeros
-        mask = np.zeros(
-            (
-                self.terrain_handler.width,
-                self.terrain_handler.length,
-            )
-        )
-        # check each point against the raw terrain height
-        for x in range(self.terrain_handler.width):
-            for z in range(self.terrain_handler.length):
-                if self.terrain_handler.get_height(x, z) < cutoff_height:
-                    mask[x, z] = 1
+        key = (LocationEnum.WATER, cutoff_height)
+        if key in self._terrain_masks:
+            return self._terrain_masks[key]
+        # check every point against the raw terrain height at once
+        heights = self._get_heights()
+        mask = heights <= cutoff_height
         # dont add the special edge mask (to avoid putting sea objects on the land)
-        return mask
+        return self._store_terrain_mask(key, mask)
 
     def _get_coast_mask(self, cutoff_height: int = -20, radius: int = 50) -> np.ndarray:
         """Generates a boolean map grid, where 1 is coast and 0 not coast, within a
@@ -327,50 +432,36 @@ class ObjectHandler:
         Returns:
             np.ndarray: Coast mask
         """
-        # assume more water than land, so start with zeros
-        mask = np.zeros(
-            (
-                self.terrain_handler.width,
-                self.terrain_handler.length,
-            )
-        )
-
+        key = (LocationEnum.COAST, cutoff_height, radius)
+        if key in self._terrain_masks:
+            return self._terrain_masks[key]
         # find edges where water meets land, by finding edges of a binary masked
         # ... terrain map
-        binary_terrain = self.terrain_handler._get_height_2d_array().copy()
-        binary_terrain[binary_terrain < 0] = 0
-        binary_terrain[binary_terrain > 0] = 1
-        edge_mask = self._get_binary_transition_mask(binary_terrain)
+        heights = self._get_heights()
+        edge_mask = self._get_binary_transition_mask(heights > 0)
 
         # Only apply radius around points that are both edges and above cutoff height
-        for x in range(self.terrain_handler.width):
-            for z in range(self.terrain_handler.length):
-                if edge_mask[x, z] == 1:
-                    mask = self._update_mask_grid_with_radius(
-                        mask, x, z, radius, set_to=1
-                    )
+        mask = self._dilate_mask(edge_mask, radius)
         # now multiply this against the land mask - so we exclude land, giving us only
         # ... coast
-        return mask * self._get_water_mask(cutoff_height=cutoff_height)
+        return self._store_terrain_mask(
+            key, mask & self._get_water_mask(cutoff_height=cutoff_height)
+        )
 
-    def _find_location(
+    def _get_free_mask(
         self,
         where: LocationEnum = LocationEnum.LAND,
-        required_radius: float = 1,
         consider_objects: bool = True,
         consider_zones: bool = False,
         extra_zone_spacing: bool = False,
         in_zone: ZoneMarker = None,
         extra_masks: np.ndarray = None,
-    ) -> tuple[float, float]:
-        """Finds a random location on the land for the specified object. Will avoid
-        clashing with other objects within their object's radius, including the
-        optional required_radius (default 1 units on original LEV scale)
+    ) -> np.ndarray:
+        """Builds the mask of free space for a new object (1 is free), before any
+        setback from the edges of that space is applied
 
         Args:
             where (LocationEnum): Where to find the location (land, water, coast)
-            required_radius (float, optional): Keep-clear radius of this new
-            ...object. Defaults to 1 (unit = the original LEV scale e.g. 256x256).
             consider_objects (bool, optional): Whether to consider other objects.
             ...Defaults to True.
             consider_zones (bool, optional): Whether to consider other zones.
@@ -379,60 +470,236 @@ class ObjectHandler:
             ...spacing around zones. Defaults to False.
             in_zone (ZoneMarker, optional): Zone to place the object in. Defaults to None.
         Returns:
-            tuple[float, float]: x,z location of the object
+            np.ndarray: Mask of free space
         """
-        # start with all 1s
-        mask = np.ones(
-            (
-                self.terrain_handler.width,
-                self.terrain_handler.length,
-            )
-        )
-
-        # check if we have a zone to place the object in
-        if in_zone is not None:
-            mask *= self._get_zone_mask_for_zone_objects(in_zone)
-
-        # get correct reference mask from where
+        # get correct reference mask from where (copied, as the cached terrain
+        # ... masks are shared)
         if where == LocationEnum.WATER:
-            mask *= self._get_water_mask()
+            mask = self._get_water_mask().copy()
         elif where == LocationEnum.COAST:
-            mask *= self._get_coast_mask()
+            mask = self._get_coast_mask().copy()
         else:
-            mask *= self._get_land_mask()
+            mask = self._get_land_mask().copy()
+
+        # check if we have a zone to place the object in (zone masks are 0/1 ints)
+        if in_zone is not None:
+            mask &= self._get_zone_mask_for_zone_objects(in_zone) > 0
 
         # apply that mask to the other masks specified in the argument
         if consider_objects:
-            mask *= self._get_object_mask()
+            mask &= self._get_object_mask()
         if consider_zones and in_zone is None:
-            mask *= self._get_all_zone_mask()
+            mask &= self._get_all_zone_mask()
         if extra_zone_spacing:
-            mask *= self._get_zone_seperation_mask(
+            mask &= self._get_zone_seperation_mask(
                 extra_zone_spacing=extra_zone_spacing
             )
         if extra_masks is not None:
-            mask *= extra_masks
+            mask &= extra_masks > 0
+        return mask
+
+    def _apply_edge_setback(
+        self, mask: np.ndarray, setback: int, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Clears (in place) every point of the mask within setback of an edge of
+        the mask, i.e. a cell where it transitions to/from 0
+
+        Args:
+            mask (np.ndarray): Boolean mask to clear the edges of
+            setback (int): Radius cleared around each edge cell
+            out (np.ndarray, optional): Scratch buffer for the transition mask,
+            ...see _get_binary_transition_mask. Defaults to None.
+
+        Returns:
+            np.ndarray: The same mask
+        """
+        edge_mask = self._get_binary_transition_mask(mask, out=out)
+        mask &= ~self._dilate_mask(edge_mask, setback)
+        return mask
+
+    def _get_location_mask(
+        self,
+        where: LocationEnum = LocationEnum.LAND,
+        required_radius: float = 1,
+        consider_objects: bool = True,
+        consider_zones: bool = False,
+        extra_zone_spacing: bool = False,
+        in_zone: ZoneMarker = None,
+        extra_masks: np.ndarray = None,
+        y_offset: Optional[float] = None,
+    ) -> np.ndarray:
+        """Builds the mask of valid locations for a new object (1 is valid), as used
+        by _find_location. Will avoid clashing with other objects within their
+        object's radius, including the optional required_radius (default 1 units on
+        original LEV scale)
+
+        Args:
+            where (LocationEnum): Where to find the location (land, water, coast)
+            required_radius (float, optional): Keep-clear radius of this new
+            ...object. Defaults to 1 (unit = the original LEV scale e.g. 256x256).
+            consider_objects (bool, optional): Whether to consider other objects.
+            ...Defaults to True.
+            consider_zones (bool, optional): Whether to consider other zones.
+            ...Defaults to False.
+            extra_zone_spacing (bool, optional): Whether to consider extra
+            ...spacing around zones. Defaults to False.
+            in_zone (ZoneMarker, optional): Zone to place the object in. Defaults to None.
+            y_offset (float, optional): Vertical offset of the object, if given
+            ...locations where the object would be under water are excluded.
+            ...Defaults to None.
+        Returns:
+            np.ndarray: Mask of valid locations
+        """
+        mask = self._get_free_mask(
+            where=where,
+            consider_objects=consider_objects,
+            consider_zones=consider_zones,
+            extra_zone_spacing=extra_zone_spacing,
+            in_zone=in_zone,
+            extra_masks=extra_masks,
+        )
 
         # detect edges, and for each edge draw a circle of radius required_radius
         # ... (rounded up to closest int)
         required_radius = max(1, round(required_radius))
-        edge_mask = self._get_binary_transition_mask(mask)
-        for x in range(self.terrain_handler.width):
-            for z in range(self.terrain_handler.length):
-                if edge_mask[x, z] == 1:
-                    mask = self._update_mask_grid_with_radius(
-                        mask,
-                        x,
-                        z,
-                        required_radius // 2,
-                        set_to=0,  # mark as not allowed
-                    )
-
-        # check if we have any non-zero values in the edge mask
-        if np.any(mask):
-            return self.noise_generator.select_random_entry_from_2d_array(mask)
-        logger.info("Find location: no suitable location found (empty mask)")
-        return None
+        self._apply_edge_setback(
+            mask, required_radius // 2, out=self._scratch_transition
+        )
+
+        # exclude anywhere the object would be placed under water (rather than
+        # ... finding a location, and then rejecting it)
+        if y_offset is not None:
+            mask &= self._get_heights() + y_offset >= 0
+        return mask
+
+    def _find_location(
+        self,
+        where: LocationEnum = LocationEnum.LAND,
+        required_radius: float = 1,
+        consider_objects: bool = True,
+        consider_zones: bool = False,
+        extra_zone_spacing: bool = False,
+        in_zone: ZoneMarker = None,
+        extra_masks: np.ndarray = None,
+        y_offset: Optional[float] = None,
+    ) -> tuple[float, float]:
+        """Finds a random location on the land for the specified object. Will avoid
+        clashing with other objects within their object's radius, including the
+        optional required_radius (default 1 units on original LEV scale)
+
+        Args:
+            where (LocationEnum): Where to find the location (land, water, coast)
+            required_radius (float, optional): Keep-clear radius of this new
+            ...object. Defaults to 1 (unit = the original LEV scale e.g. 256x256).
+            consider_objects (bool, optional): Whether to consider other objects.
+            ...Defaults to True.
+            consider_zones (bool, optional): Whether to consider other zones.
+            ...Defaults to False.
+            extra_zone_spacing (bool, optional): Whether to consider extra
+            ...spacing around zones. Defaults to False.
+            in_zone (ZoneMarker, optional): Zone to place the object in. Defaults to None.
+            y_offset (float, optional): Vertical offset of the object, if given
+            ...locations where the object would be under water are excluded.
+            ...Defaults to None.
+        Returns:
+            tuple[float, float]: x,z location of the object
+        """
+        mask = self._get_location_mask(
+            where=where,
+            required_radius=required_radius,
+            consider_objects=consider_objects,
+            consider_zones=consider_zones,
+            extra_zone_spacing=extra_zone_spacing,
+            in_zone=in_zone,
+            extra_masks=extra_masks,
+            y_offset=y_offset,
+        )
+
+        location = self.noise_generator.select_random_entry_from_2d_array(mask)
+        if location is None:
+            logger.info("Find location: no suitable location found (empty mask)")
+        return location
+
+    def _iter_valid_positions(
+        self,
+        where: LocationEnum = LocationEnum.LAND,
+        required_radius: float = 1,
+        n: int = 1,
+        consider_zones: bool = False,
+        y_offset: Optional[float] = None,
+    ) -> Iterator[tuple[int, int]]:
+        """Yields up to n random locations for objects of the same required_radius.
+        The location mask is only built once. Each yielded location is then
+        cleared from it as if the object had been added, and the edge setback
+        around it is re-applied, so following locations have the same spacing
+        _find_location would give. Use instead of calling _find_location for
+        every object when placing many similar objects
+
+        Args:
+            where (LocationEnum): Where to find the locations (land, water, coast)
+            required_radius (float, optional): Keep-clear radius of each object.
+            ...Defaults to 1 (unit = the original LEV scale e.g. 256x256).
+            n (int, optional): Maximum number of locations. Defaults to 1.
+            consider_zones (bool, optional): Whether to consider other zones.
+            ...Defaults to False.
+            y_offset (float, optional): Vertical offset of the objects, if given
+            ...locations where they would be under water are excluded.
+            ...Defaults to None.
+
+        Yields:
+            tuple[int, int]: x,z location for the next object
+        """
+        # keep the free space (before the edge setback) so the setback can be
+        # ... re-applied around each yielded location
+        free_mask = self._get_free_mask(where=where, consider_zones=consider_zones)
+        required_radius = max(1, round(required_radius))
+        setback = required_radius // 2
+        mask = self._apply_edge_setback(
+            free_mask.copy(), setback, out=self._scratch_transition
+        )
+        above_water = None
+        if y_offset is not None:
+            above_water = self._get_heights() + y_offset >= 0
+            mask &= above_water
+
+        # adding an object changes the edges within required_radius + 1 of it, and
+        # ... so the setback within another setback of those. The edges are found
+        # ... from a window one setback (and a cell) wider, so they are the same as
+        # ... for the whole mask
+        width, length = mask.shape
+        inner = required_radius + 1 + setback
+        outer = inner + setback + 1
+
+        # visit the valid locations in a random order, skipping any that have
+        # ... been cleared by earlier locations
+        locations = np.argwhere(mask > 0)
+        n_yielded = 0
+        for index in self.noise_generator.random_permutation(len(locations)):
+            if n_yielded >= n:
+                return
+            x, z = locations[index]
+            if not mask[x, z]:
+                continue
+            self._update_mask_grid_with_radius(
+                free_mask, x, z, required_radius, set_to=0
+            )
+            outer_x, outer_z = max(x - outer, 0), max(z - outer, 0)
+            window = self._apply_edge_setback(
+                free_mask[outer_x : x + outer + 1, outer_z : z + outer + 1].copy(),
+                setback,
+            )
+            inner_x = slice(max(x - inner, 0), min(x + inner + 1, width))
+            inner_z = slice(max(z - inner, 0), min(z + inner + 1, length))
+            mask[inner_x, inner_z] = window[
+                inner_x.start - outer_x : inner_x.stop - outer_x,
+                inner_z.start - outer_z : inner_z.stop - outer_z,
+            ]
+            if above_water is not None:
+                mask[inner_x, inner_z] &= above_water[inner_x, inner_z]
+            n_yielded += 1
+            yield int(x), int(z)
+        if n_yielded < n:
+            logger.info(f"Iter valid positions: only found {n_yielded}/{n} locations")
 
     def add_carrier_and_return_mask(
         self, required_radius: int = 30, mask_radius: int = 70
@@ -480,7 +747,7 @@ class ObjectHandler:
         logger.info("ADD Carrier: Calculating mask...")
         # start with array of 0s (assume radius is small)
         mask = np.zeros(
-            (self.terrain_handler.width, self.terrain_handler.length), dtype=np.uint8
+            (self.terrain_handler.width, self.terrain_handler.length), dtype=bool
         )
         # then loop through and set 1 for locations within radius
         for i in range(self.terrain_handler.width):
@@ -519,6 +786,7 @@ class ObjectHandler:
             consider_zones=consider_zones,
             in_zone=in_zone,
             extra_masks=extra_masks,
+            y_offset=ref_object.y_offset,
         )
         if returnval is None:
             return
@@ -601,10 +869,49 @@ class ObjectHandler:
             required_radius=required_radius,
             consider_zones=consider_zones,
             in_zone=in_zone,
+            y_offset=y_offset,
         )
         if returnval is None:
             return
         x, z = returnval
+        return self._add_object_on_land(
+            object_type,
+            x,
+            z,
+            attachment_type=attachment_type,
+            team=team,
+            y_offset=y_offset,
+            y_rotation=y_rotation,
+            required_radius=required_radius,
+        )
+
+    def _add_object_on_land(
+        self,
+        object_type: str,
+        x: int,
+        z: int,
+        attachment_type: str = "",
+        team: Union[int | Team] = Team.ENEMY,
+        y_offset: float = 0,
+        y_rotation: float = 0,
+        required_radius: float = 1,
+    ) -> int:
+        """Adds an object at an already selected x,z location, with the height
+        determined from the terrain (unless it would be under water)
+
+        Args:
+            object_type (str): Type of the object
+            x (int): x location (original LEV scale)
+            z (int): z location (original LEV scale)
+            attachment_type (str, optional): Type of attachment. Defaults to "".
+            team (Union[int | Team], optional): Team number. Defaults to Team.ENEMY.
+            y_offset (float, optional): Vertical offset of the object. Defaults to 0.
+            y_rotation (float, optional): Rotation of the object in degrees. Defaults to 0.
+            required_radius (float, optional): Keep-clear radius of this new object. Defaults to 1.
+
+        Returns:
+            int: The ID of the new object
+        """
         # find height at the specified x and z location (in LEV 3D space)
         height = self.terrain_handler.get_height(x, z)
         # check the height isnt negative, else its water so dont add
@@ -638,11 +945,12 @@ class ObjectHandler:
         if carrier_xz is not None:
             # create an exclusion mask within radius of 60 of the carrier (e.g.
             # ... dont put a radar where the carrier will see it)
-            extra_mask = self._update_mask_grid_with_radius(
-                np.ones(
-                    (self.terrain_handler.width, self.terrain_handler.length),
-                    dtype=np.uint8,
-                ),
+            extra_mask = np.ones(
+                (self.terrain_handler.width, self.terrain_handler.length),
+                dtype=bool,
+            )
+            self._update_mask_grid_with_radius(
+                extra_mask,
                 carrier_xz[0],
                 carrier_xz[1],
                 60,
@@ -666,28 +974,36 @@ class ObjectHandler:
         """Adds a lot of random/different scenery objects to the level"""
         # TODO in future, switch below on map size - the below seems reasonable
         # ... for 'large' 256x256
-        objs = (
-            ["troprockcd"] * 8
-            + ["troprockbd"] * 7
-            + ["troprockad"] * 6
-            + ["troprockcw"] * 5
-            + ["troprockaw"] * 2
-            + ["palm1"] * 80
-            + ["plant1"] * 30
-            + ["palm2"] * 50
-            + ["palm3"] * 25
-            + ["rubblea"] * 5
-            + ["rubbleb"] * 5
-            + ["rubblec"] * 5
-            + ["rubbled"] * 5
-            + ["rubblee"] * 5
-        )
-        for obj in objs:
-            self.add_object_on_land_random(
-                obj,
-                team=Team.NEUTRAL,
-                required_radius=2,
-                consider_zones=True,
+        objs = [
+            object_type
+            for object_type, count in _SCENERY_COUNTS.items()
+            for _ in range(count)
+        ]
+        # all scenery has the same radius, so find all the locations in one go and
+        # ... look up all of their heights at once
+        required_radius = 2
+        locations = np.array(
+            list(
+                self._iter_valid_positions(
+                    required_radius=required_radius,
+                    n=len(objs),
+                    consider_zones=True,
+                    y_offset=0,
+                )
+            ),
+            dtype=int,
+        ).reshape(-1, 2)
+        heights = self._get_heights()[locations[:, 0], locations[:, 1]]
+        positions = np.stack([locations[:, 0], heights, locations[:, 1]], axis=1)
+        for obj, (x, z), position in zip(objs, locations, positions):
+            # skip anything that would be under water
+            if position[1] < 0:
+                continue
+            self._update_cached_object_mask(x, z, required_radius)
+            self.ob3_interface.add_object(
+                object_type=obj,
+                location=position,
+                team=Team.NEUTRAL.value,
             )
         logger.info(f"Done adding {len(objs)} scenery objects")
 
@@ -224,15 +224,74 @@ class TerrainHandler:
                     self.terrain_points[x, y].mat = zone.texture_id + texture_offset
         logger.info("Applying zone texture: Completed")
 
-    def flatten_terrain_based_on_zone(
+    def get_zone_falloff_distance(
         self, zone: Zone, all_existing_zones: list[Zone], smooth_radius: int = 10
+    ) -> np.ndarray:
+        """Calculates the (manhattan) distance of each terrain point from the boundary
+        of the zone, used for the flattening falloff. Points further than
+        smooth_radius, or inside any existing zone, are set to smooth_radius + 1.
+        Only depends on the zone masks (not the terrain heights), so it can be
+        calculated for all zones up front/in parallel.
+
+        Args:
+            zone (Zone): Zone object defining the mask
+            all_existing_zones (list[Zone]): All zones (these are not smoothed)
+            smooth_radius (int): Radius of smoothing area outside the zone
+
+        Returns:
+            np.ndarray: Distance from the zone boundary for each terrain point
+        """
+        zone_mask = zone.mask().astype(bool)
+
+        # identify the boundary points of the zone (has at least one non-zone
+        # ... neighbor, ignoring neighbors off the edge of the map)
+        padded = np.pad(zone_mask, 1, constant_values=True)
+        interior = (
+            padded[:-2, 1:-1] & padded[2:, 1:-1] & padded[1:-1, :-2] & padded[1:-1, 2:]
+        )
+        boundary = zone_mask & ~interior
+
+        # issue 6 - get a mask of all existing zones and dont smooth
+        # ... if the point is inside any other zones' mask (to prevent
+        # .... smoothing an adjacent zone). This includes this zone
+        all_zones_mask = np.zeros((self.width, self.length), dtype=bool)
+        for other_zone in all_existing_zones:
+            all_zones_mask |= other_zone.mask().astype(bool)
+
+        # grow out from the boundary one cell at a time - growing to the 4
+        # ... neighbors each step gives the manhattan distance
+        distance = np.full((self.width, self.length), smooth_radius + 1)
+        distance[boundary] = 0
+        reached = boundary
+        for step in range(1, smooth_radius + 1):
+            grown = reached.copy()
+            grown[1:, :] |= reached[:-1, :]
+            grown[:-1, :] |= reached[1:, :]
+            grown[:, 1:] |= reached[:, :-1]
+            grown[:, :-1] |= reached[:, 1:]
+            distance[grown & ~reached] = step
+            reached = grown
+
+        # Skip points inside any existing zone
+        distance[all_zones_mask] = smooth_radius + 1
+        return distance
+
+    def flatten_terrain_based_on_zone(
+        self,
+        zone: Zone,
+        all_existing_zones: list[Zone],
+        smooth_radius: int = 10,
+        falloff_distance: np.ndarray = None,
     ) -> None:
         """
         Flattens and smooths the terrain around a flattened zone using a falloff function.
 
         Args:
             zone (Zone): Zone object defining the mask
+            all_existing_zones (list[Zone]): All zones (these are not smoothed)
             smooth_radius (int): Radius of smoothing area outside the zone
+            falloff_distance (np.ndarray, optional): Precomputed result of
+            ...get_zone_falloff_distance. Calculated here if None. Defaults to None.
         """
         zone_mask = zone.mask()
 
@@ -257,50 +316,22 @@ class TerrainHandler:
                 if zone_mask[x, y]:
                     self.terrain_points[x, y].height = avg_height
 
-        # Simple linear falloff around the zone
-        # First identify the boundary points of the zone
-        boundary_points = []
-        for x in range(self.width):
-            for y in range(self.length):
-                if zone_mask[x, y]:
-                    # Check if this is a boundary point (has at least one non-zone neighbor)
-                    if ((x > 0 and not zone_mask[x-1, y]) or
-                        (x < self.width-1 and not zone_mask[x+1, y]) or
-                        (y > 0 and not zone_mask[x, y-1]) or
-                        (y < self.length-1 and not zone_mask[x, y+1])):
-                        boundary_points.append((x, y))
+        # Simple linear falloff around the zone, based on the distance to the
+        # ... boundary points of the zone
+        if falloff_distance is None:
+            falloff_distance = self.get_zone_falloff_distance(
+                zone, all_existing_zones, smooth_radius
+            )
 
-        # issue 6 - get a mask of all existing zones and dont smooth
-        # ... if the point is inside any other zones' mask (to prevent
-        # .... smoothing an adjacent zone). This includes this zone
-        all_zones_mask = np.zeros((self.width, self.length))
-        for other_zone in all_existing_zones:
-            all_zones_mask += other_zone.mask()
+        # Apply falloff to points outside the zone (within smooth_radius)
+        for x, y in np.argwhere(falloff_distance <= smooth_radius):
+            # Linear falloff factor
+            falloff = 1.0 - (int(falloff_distance[x, y]) / smooth_radius)
+
+            # Apply linear interpolation
+            original_height = self.terrain_points[x, y].height
+            self.terrain_points[x, y].height = (
+                falloff * avg_height + (1 - falloff) * original_height
+            )
 
-        # Apply falloff to points outside the zone
-        for x in range(self.width):
-            for y in range(self.length):
-                # Skip points inside any existing zone
-                if all_zones_mask[x, y]:
-                    continue
-                
-                # Find minimum distance to any boundary point
-                min_dist = smooth_radius + 1
-                for bx, by in boundary_points:
-                    # Use Manhattan distance for simplicity
-                    dist = abs(x - bx) + abs(y - by)
-                    if dist < min_dist:
-                        min_dist = dist
-                
-                # Apply falloff if within smooth_radius
-                if min_dist <= smooth_radius:
-                    # Linear falloff factor
-                    falloff = 1.0 - (min_dist / smooth_radius)
-                    
-                    # Apply linear interpolation
-                    original_height = self.terrain_points[x, y].height
-                    self.terrain_points[x, y].height = (
-                        falloff * avg_height + (1 - falloff) * original_height
-                    )
-        
         logger.info(f"Zone: Flattening terrain: Set zone to height {avg_height} with simple linear falloff")
@@ -192,7 +192,7 @@ class ZoneManager:
                 extra_masks=self.object_handler.get_inclusion_mask_at_location(
                     base_zone.x, base_zone.z, 40
                 )
-                * self.object_handler._get_all_zone_mask([base_zone]),
+                & self.object_handler._get_all_zone_mask([base_zone]),
                 extra_zone_spacing=20,  # try reduced spacing
             )
             if zone is None:
@@ -237,8 +237,9 @@ class ZoneManager:
             return (x, z), (x, z)
 
         # create a custom mask within a radius of 15 of the new scrap zone
-        nearby_scrap_mask = self.object_handler._update_mask_grid_with_radius(
-            np.zeros_like(carrier_mask),
+        nearby_scrap_mask = np.zeros_like(carrier_mask)
+        self.object_handler._update_mask_grid_with_radius(
+            nearby_scrap_mask,
             radius=15,
             x=self.object_handler.zones[0].x,
             z=self.object_handler.zones[0].z,
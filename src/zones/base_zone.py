@@ -26,6 +26,7 @@ from models import (
     ZoneSize,
     ZoneType,
     ObjectContainer,
+    WeightedTable,
     ZONE_SIZE_TO_RADIUS,
     ZONE_SIZE_TO_NUM_OBJECTS,
     ZONE_TYPE_TO_TEXTURE_ID,
@@ -38,17 +39,17 @@ class ZoneObjectDetails:
     """Small container class for zone object details
 
     Args:
-        other_objs (dict[ObjectContainer, int]): Other objects to be placed in the zone
-        priority_1_objs (dict[ObjectContainer, int]): Priority 1 objects to be placed in the zone (optional)
+        other_objs (WeightedTable): Other objects to be placed in the zone
+        priority_1_objs (WeightedTable): Priority 1 objects to be placed in the zone (optional)
         p1_num (int): Number of priority 1 objects to be placed in the zone (optional)
-        priority_2_objs (dict[ObjectContainer, int]): Priority 2 objects to be placed in the zone (optional)
+        priority_2_objs (WeightedTable): Priority 2 objects to be placed in the zone (optional)
         p2_num (int): Number of priority 2 objects to be placed in the zone (optional)
     """
 
-    other_objs: dict[ObjectContainer, int]
-    priority_1_objs: dict[ObjectContainer, int] = field(default_factory=dict)
+    other_objs: WeightedTable
+    priority_1_objs: WeightedTable = field(default_factory=WeightedTable)
     p1_num: int = 0
-    priority_2_objs: dict[ObjectContainer, int] = field(default_factory=dict)
+    priority_2_objs: WeightedTable = field(default_factory=WeightedTable)
     p2_num: int = 0
 
 
@@ -235,19 +236,19 @@ class Zone(ABC):
         p1_num = zone_object_details.p1_num
         p2_num = zone_object_details.p2_num
         priority_1_objs = [
-            noise_generator.select_random_from_weighted_dict(
+            noise_generator.select_random_from_weighted_table(
                 zone_object_details.priority_1_objs
             )
             for _ in range(p1_num)
         ]
         priority_2_objs = [
-            noise_generator.select_random_from_weighted_dict(
+            noise_generator.select_random_from_weighted_table(
                 zone_object_details.priority_2_objs
             )
             for _ in range(p2_num)
         ]
         all_base_objs = [
-            noise_generator.select_random_from_weighted_dict(
+            noise_generator.select_random_from_weighted_table(
                 zone_object_details.other_objs
             )
             for _ in range(self.max_objects - p1_num - p2_num)
@@ -15,6 +15,7 @@ if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
 from noisegen import NoiseGenerator
+from models import WeightedTable
 
 
 @pytest.fixture
@@ -46,3 +47,32 @@ def test_select_random_entry_from_2d_array(noise_generator):
         assert (x, y) in valid_positions
         # Double check that the value at the selected position is actually 1
         assert test_array[x, y] == 1
+
+
+def test_select_random_entry_from_2d_array_empty():
+    """Test that select_random_entry_from_2d_array returns None if no entry is
+    non-zero"""
+    generator = NoiseGenerator(seed=0)
+    assert generator.select_random_entry_from_2d_array(np.zeros((3, 4))) is None
+
+
+def test_select_random_from_weighted_table():
+    """Test that weighted table selection matches picking from a flat list where
+    each item appears weight times"""
+    weights = {"a": 3, "b": 0, "c": 1, "d": 2}
+    table = WeightedTable.from_dict(weights)
+    flat_list = [key for key, weight in weights.items() for _ in range(weight)]
+
+    generator = NoiseGenerator(seed=0)
+    for point in range(len(flat_list)):
+        generator.randint = lambda a, b: point
+        assert generator.select_random_from_weighted_table(table) == flat_list[point]
+
+
+def test_random_noisemap_is_seeded():
+    """Test that the same seed gives the same (normalised) noise map"""
+    first = NoiseGenerator(seed=1234).random_noisemap(128, 128)
+    second = NoiseGenerator(seed=1234).random_noisemap(128, 128)
+    assert first.shape == (128, 128)
+    assert first.min() == 0 and first.max() == 1
+    np.testing.assert_array_equal(first, second)
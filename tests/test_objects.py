@@ -11,6 +11,7 @@ src_dir = os.path.join(os.path.dirname(current_dir), "src")
 if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
+import objects
 from objects import ObjectHandler
 
 
@@ -22,12 +23,15 @@ def test_get_land_mask():
     obj_handler.terrain_handler.width = 3
     obj_handler.terrain_handler.length = 3
 
-    # Mock get_height to return a simple height map:
+    # Mock the height array to return a simple height map:
     # [-30, -10, 0]
     # [-20, 10, 20]
     # [0, 30, 40]
-    height_map = [[-30, -10, 0], [-20, 10, 20], [0, 30, 40]]
-    obj_handler.terrain_handler.get_height = lambda x, z: height_map[x][z]
+    height_map = np.array([[-30, -10, 0], [-20, 10, 20], [0, 30, 40]])
+    obj_handler.terrain_handler._get_height_2d_array = lambda: height_map
+    obj_handler.invalidate_terrain_masks()
+    # no edge setback, so only the height threshold is tested
+    obj_handler._get_binary_transition_mask = lambda arr: np.zeros_like(arr)
 
     # Test land mask with default cutoff (-20)
     land_mask = obj_handler._get_land_mask()
@@ -60,12 +64,13 @@ def test_get_water_mask():
     obj_handler.terrain_handler.width = 3
     obj_handler.terrain_handler.length = 3
 
-    # Mock get_height to return a simple height map:
+    # Mock the height array to return a simple height map:
     # [-30, -10, 0]
     # [-20, 10, 20]
     # [0, 30, 40]
-    height_map = [[-30, -10, 0], [-20, 10, 20], [0, 30, 40]]
-    obj_handler.terrain_handler.get_height = lambda x, z: height_map[x][z]
+    height_map = np.array([[-30, -10, 0], [-20, 10, 20], [0, 30, 40]])
+    obj_handler.terrain_handler._get_height_2d_array = lambda: height_map
+    obj_handler.invalidate_terrain_masks()
 
     # Test water mask with default cutoff (-20)
     water_mask = obj_handler._get_water_mask()
@@ -146,3 +151,60 @@ def test_get_binary_transition_mask():
     expected_mask = np.ones((3, 3))
 
     np.testing.assert_array_equal(transition_mask, expected_mask)
+
+
+def _brute_force_disks(shape, centres, radius):
+    """Mask of every point within radius of any of the centres"""
+    x, z = np.indices(shape)
+    covered = np.zeros(shape, dtype=bool)
+    for cx, cz in centres:
+        covered |= (x - cx) ** 2 + (z - cz) ** 2 <= radius * radius
+    return covered
+
+
+@patch("objects.ObjectHandler.__init__", lambda self, *args, **kwargs: None)
+def test_update_mask_grid_with_radius():
+    """Test disk stamping against a brute force disk, including centres near or
+    off the edge of the grid (clipped disks)"""
+    shape = (12, 9)
+    obj_handler = ObjectHandler()
+    obj_handler.terrain_handler = MagicMock()
+    obj_handler.terrain_handler.width, obj_handler.terrain_handler.length = shape
+
+    centres = [(5, 4), (0, 0), (11, 8), (-2, 3), (6, 10), (-3, -3), (14, 2), (30, 30)]
+    for radius in [0, 1, 3, 7]:
+        for centre in centres:
+            expected = _brute_force_disks(shape, [centre], radius)
+
+            # clearing an occupied grid
+            grid = np.ones(shape, dtype=bool)
+            obj_handler._update_mask_grid_with_radius(grid, *centre, radius, set_to=0)
+            np.testing.assert_array_equal(grid, ~expected)
+
+            # setting an empty (integer) grid
+            grid = np.zeros(shape, dtype=int)
+            obj_handler._update_mask_grid_with_radius(grid, *centre, radius, set_to=1)
+            np.testing.assert_array_equal(grid, expected.astype(int))
+
+
+@patch("objects.ObjectHandler.__init__", lambda self, *args, **kwargs: None)
+def test_dilate_mask():
+    """Test dilation against stamping a brute force disk at every point,
+    including points on the edges of the mask and radii wider than it"""
+    obj_handler = ObjectHandler()
+
+    rng = np.random.default_rng(0)
+    shape = (11, 7)
+    border = np.zeros(shape, dtype=bool)
+    border[0, 3] = border[-1, 0] = border[5, -1] = True
+    masks = [
+        np.zeros(shape, dtype=bool),
+        border,
+        rng.random(shape) > 0.9,
+        np.ones(shape, dtype=bool),
+    ]
+    for radius in [0, 1, 2, 5, 7, 12]:
+        for input_mask in masks:
+            expected = _brute_force_disks(shape, np.argwhere(input_mask), radius)
+            dilated = obj_handler._dilate_mask(input_mask, radius)
+            np.testing.assert_array_equal(dilated, expected)
@@ -0,0 +1,138 @@
+"""
+Tests for the TerrainHandler class
+"""
+
+import os
+import sys
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add the src directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(os.path.dirname(current_dir), "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from terrain import TerrainHandler
+
+
+def _make_zone(mask):
+    return SimpleNamespace(mask=lambda: mask)
+
+
+def _make_terrain_handler(heights):
+    terrain_handler = TerrainHandler(None, None)
+    terrain_handler.width, terrain_handler.length = heights.shape
+    terrain_handler.terrain_points = np.empty(heights.shape, dtype=object)
+    for (x, y), height in np.ndenumerate(heights):
+        terrain_handler.terrain_points[x, y] = SimpleNamespace(height=float(height))
+    return terrain_handler
+
+
+def _reference_flatten(heights, zone_mask, all_zone_masks, smooth_radius):
+    """Per-point boundary search that flatten_terrain_based_on_zone used to do"""
+    heights = heights.astype(float)
+    width, length = heights.shape
+
+    avg_height = 0
+    count = 0
+    for x in range(width):
+        for y in range(length):
+            if zone_mask[x, y]:
+                avg_height += max(60, heights[x, y])
+                count += 1
+    if count > 0:
+        avg_height /= count
+    avg_height = max(avg_height, 60)
+    heights[zone_mask > 0] = avg_height
+
+    boundary_points = []
+    for x in range(width):
+        for y in range(length):
+            if zone_mask[x, y]:
+                if (
+                    (x > 0 and not zone_mask[x - 1, y])
+                    or (x < width - 1 and not zone_mask[x + 1, y])
+                    or (y > 0 and not zone_mask[x, y - 1])
+                    or (y < length - 1 and not zone_mask[x, y + 1])
+                ):
+                    boundary_points.append((x, y))
+
+    all_zones_mask = sum(all_zone_masks)
+    for x in range(width):
+        for y in range(length):
+            if all_zones_mask[x, y]:
+                continue
+            min_dist = smooth_radius + 1
+            for bx, by in boundary_points:
+                dist = abs(x - bx) + abs(y - by)
+                if dist < min_dist:
+                    min_dist = dist
+            if min_dist <= smooth_radius:
+                falloff = 1.0 - (min_dist / smooth_radius)
+                heights[x, y] = falloff * avg_height + (1 - falloff) * heights[x, y]
+    return heights
+
+
+def _zone_masks(shape):
+    """A handful of zone layouts: interior, touching the edges, irregular and
+    adjacent to another zone"""
+    rng = np.random.default_rng(0)
+    interior = np.zeros(shape, dtype=int)
+    interior[10:16, 12:20] = 1
+    corner = np.zeros(shape, dtype=int)
+    corner[:7, -5:] = 1
+    blob = (rng.random(shape) > 0.93).astype(int)
+    adjacent = np.zeros(shape, dtype=int)
+    adjacent[16:22, 12:20] = 1
+    return [
+        (interior, [interior]),
+        (corner, [corner, interior]),
+        (blob, [blob]),
+        (interior, [interior, adjacent]),
+    ]
+
+
+@pytest.mark.parametrize("smooth_radius", [1, 4, 10])
+@patch("terrain.TerrainHandler.__post_init__", lambda self: None)
+def test_flatten_terrain_based_on_zone_matches_boundary_search(smooth_radius):
+    """Test the grown falloff distance flattens the same as the per-point search"""
+    shape = (32, 28)
+    heights = np.random.default_rng(1).uniform(-50, 400, shape)
+
+    for zone_mask, all_zone_masks in _zone_masks(shape):
+        terrain_handler = _make_terrain_handler(heights)
+        terrain_handler.flatten_terrain_based_on_zone(
+            _make_zone(zone_mask),
+            [_make_zone(mask) for mask in all_zone_masks],
+            smooth_radius,
+        )
+        flattened = np.array(
+            [[point.height for point in row] for row in terrain_handler.terrain_points]
+        )
+        expected = _reference_flatten(heights, zone_mask, all_zone_masks, smooth_radius)
+        np.testing.assert_array_equal(flattened, expected)
+
+
+@patch("terrain.TerrainHandler.__post_init__", lambda self: None)
+def test_get_zone_falloff_distance():
+    """Test the falloff distance on a small zone, including the edge of the map"""
+    zone_mask = np.zeros((5, 6), dtype=int)
+    zone_mask[0, 2:4] = 1
+    terrain_handler = _make_terrain_handler(np.zeros((5, 6)))
+
+    distance = terrain_handler.get_zone_falloff_distance(
+        _make_zone(zone_mask), [_make_zone(zone_mask)], smooth_radius=2
+    )
+    expected = np.array(
+        [
+            [2, 1, 3, 3, 1, 2],
+            [3, 2, 1, 1, 2, 3],
+            [3, 3, 2, 2, 3, 3],
+            [3, 3, 3, 3, 3, 3],
+            [3, 3, 3, 3, 3, 3],
+        ]
+    )
+    np.testing.assert_array_equal(distance, expected)